@@ -36,14 +36,20 @@ Architecture:
                       └───────────────┘
 """
 
-import argparse
+from __future__ import annotations
+
+import atexit
 import json
 import os
+import selectors
 import signal
 import subprocess
 import sys
-import threading
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 # ============================================================================
 # CONFIGURATION
@@ -52,6 +58,7 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 _DESKTOP_DIR = os.path.dirname(os.path.dirname(os.path.dirname(SCRIPT_DIR)))
 #  power_manager/ → src/ → power-manager/ → desktop/
 DEFAULT_ANIMATION = "fire"  # Available: fire, fade, sakura, none
+DEFAULT_HOLD_TIME = 3  # Seconds to hold black screen in test mode
 DEBUG_LOG = "/tmp/power-manager-debug.log"
 
 # Animation discovery - try to import from shutdown-effect, fallback to local logic
@@ -104,35 +111,78 @@ except (ImportError, FileNotFoundError, AttributeError):
         if not animations_dir or not os.path.isdir(animations_dir):
             return []
         animations = []
-        for name in os.listdir(animations_dir):
-            script = os.path.join(animations_dir, name, "animate.py")
-            if os.path.exists(script):
-                animations.append(name)
+        with os.scandir(animations_dir) as it:
+            for entry in it:
+                # is_dir() uses the cached dirent type; only symlinks need a stat
+                if entry.is_dir() and os.access(os.path.join(entry.path, "animate.py"), os.F_OK):
+                    animations.append(entry.name)
         return sorted(animations)
 
 
 def install_signal_handlers():
-    """Ignore SIGTERM/SIGINT to stay alive during shutdown."""
-    def signal_handler(signum, frame):
-        pass
-    signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal_handler)
+    """Ignore SIGTERM/SIGINT to stay alive during shutdown.
+
+    SIG_IGN is inherited by child processes, so call this only after the
+    animation has been spawned - it must stay killable. Power commands get
+    the defaults back via _restore_default_signals().
+    """
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def _restore_default_signals():
+    """Undo install_signal_handlers() before exec'ing a power command."""
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
 
 
 # Power commands (None = test mode)
 POWER_COMMANDS = {
-    "shutdown": ["systemctl", "poweroff"],
-    "reboot": ["systemctl", "reboot"],
-    "logout": ["loginctl", "terminate-session", ""],
-    "suspend": ["systemctl", "suspend"],
-    "hibernate": ["systemctl", "hibernate"],
-    "windows": ["systemctl", "reboot"],
+    "shutdown": ("systemctl", "poweroff"),
+    "reboot": ("systemctl", "reboot"),
+    "logout": ("loginctl", "terminate-session", ""),
+    "suspend": ("systemctl", "suspend"),
+    "hibernate": ("systemctl", "hibernate"),
+    # Only efibootmgr needs root; reboot goes through polkit even if sudo fails
+    "windows": ("sh", "-c", "sudo -A efibootmgr --bootnext 0003"
+                " || echo 'WARNING: Could not set Windows boot entry' >&2;"
+                " exec systemctl reboot"),
     "test": None,
 }
 
+# Actions after which power-manager has nothing left to do
+TERMINAL_ACTIONS = {"shutdown", "reboot", "windows", "logout"}
+
 
 def get_session_id():
     """Get current login session ID."""
+    return os.environ.get("XDG_SESSION_ID") or _logind_session_id() or _loginctl_session_id()
+
+
+def _logind_session_id():
+    """Get login session ID from systemd-logind over D-Bus (requires sdbus)."""
+    try:
+        import sdbus
+    except ImportError:
+        return ""
+
+    class LogindSession(sdbus.DbusInterfaceCommon, interface_name="org.freedesktop.login1.Session"):
+        @sdbus.dbus_property("s")
+        def id(self) -> str:
+            raise NotImplementedError
+
+    try:
+        # "auto" resolves to the caller's own session
+        session = LogindSession("org.freedesktop.login1", "/org/freedesktop/login1/session/auto",
+                                sdbus.sd_bus_open_system())
+        return session.id
+    except Exception:
+        # No debug_log here: the no-animation path runs before the log is set up
+        return ""
+
+
+def _loginctl_session_id():
+    """Get login session ID from loginctl (when XDG_SESSION_ID is unset)."""
     try:
         result = subprocess.run(
             ["loginctl", "list-sessions", "--no-legend"],
@@ -147,19 +197,33 @@ def get_session_id():
     return ""
 
 
+_LOG_FH = None  # Line-buffered handle to DEBUG_LOG, opened once
+_LOG_UTC_OFFSET = 0  # Local UTC offset in seconds, sampled when the log opens
+
+
+def _open_debug_log(mode):
+    """Open DEBUG_LOG as the shared line-buffered log handle."""
+    global _LOG_FH, _LOG_UTC_OFFSET
+    _LOG_UTC_OFFSET = time.localtime().tm_gmtoff
+    if _LOG_FH is not None:
+        _LOG_FH.close()
+    else:
+        atexit.register(lambda: _LOG_FH.close())
+    _LOG_FH = open(DEBUG_LOG, mode, buffering=1)
+
+
 def debug_log(msg):
     """Write debug message to file with timestamp."""
-    timestamp = time.strftime("%H:%M:%S")
-    with open(DEBUG_LOG, "a") as f:
-        f.write(f"[{timestamp}] {msg}\n")
-        f.flush()
+    if _LOG_FH is None:
+        _open_debug_log("a")
+    t = (int(time.time()) + _LOG_UTC_OFFSET) % 86400
+    _LOG_FH.write(f"[{t // 3600:02d}:{t // 60 % 60:02d}:{t % 60:02d}] {msg}\n")
 
 
 def init_debug_log():
     """Initialize debug log file."""
-    with open(DEBUG_LOG, "w") as f:
-        f.write(f"=== Power Manager Debug Log - {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
-        f.flush()
+    _open_debug_log("w")
+    _LOG_FH.write(f"=== Power Manager Debug Log - {time.strftime('%Y-%m-%d %H:%M:%S')} ===\n")
 
 
 class AnimationProcess:
@@ -169,14 +233,18 @@ class AnimationProcess:
     - "READY" = screenshot captured, overlay visible, safe to proceed
     - "BLACK" = animation complete, screen is fully black
     - Animation must NOT exit - it holds the black screen until killed
+
+    The animation inherits a copy of the pipe's read end, so its stdout keeps
+    a reader even after power-manager execs the power command.
     """
 
     def __init__(self, script_path):
         self.script_path = script_path
         self.process = None
-        self.ready_event = threading.Event()
-        self.black_event = threading.Event()
-        self._reader_thread = None
+        self._signal_fd = None
+        self._selector = None
+        self._buffer = b""
+        self._seen_signals = set()
 
     def start(self):
         """Start the animation subprocess."""
@@ -186,51 +254,70 @@ class AnimationProcess:
             return False
 
         debug_log(f"Starting animation: {self.script_path}")
-        self.process = subprocess.Popen(
-            ["python3", self.script_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1  # Line buffered
-        )
-
-        # Start reader thread to watch for signals
-        self._reader_thread = threading.Thread(target=self._read_signals, daemon=True)
-        self._reader_thread.start()
+        # Our read end is close-on-exec and goes away with exec_power_command();
+        # the copy passed to the animation keeps late writes from hitting EPIPE
+        read_fd, write_fd = os.pipe()
+        try:
+            self.process = subprocess.Popen(
+                # System python3, not sys.executable: an installed power-manager may
+                # run from a venv without the GTK bindings animations need
+                ["python3", self.script_path],
+                stdout=write_fd,
+                # Straight into the debug log (opened by the debug_log() above);
+                # an unread pipe could fill and block the animation
+                stderr=_LOG_FH,
+                pass_fds=(read_fd,),
+            )
+        except OSError:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+        self._signal_fd = read_fd
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(read_fd, selectors.EVENT_READ)
         return True
 
-    def _read_signals(self):
-        """Read stdout from animation process for READY/BLACK signals."""
+    def wait_for_signal(self, token, timeout):
+        """Wait until the animation emits token on stdout.
+
+        Signals read while waiting for a different token are remembered, so
+        READY arriving before wait_for_signal("READY") is never lost.
+        """
+        debug_log(f"Waiting for {token} signal (timeout={timeout}s)")
+        expected = token.encode()
+        deadline = time.monotonic() + timeout
         try:
-            for line in self.process.stdout:
-                line = line.strip()
-                debug_log(f"Animation signal: {line}")
-                if line == "READY":
-                    self.ready_event.set()
-                elif line == "BLACK":
-                    self.black_event.set()
-        except Exception as e:
+            while expected not in self._seen_signals:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    debug_log(f"WARNING: Timeout waiting for {token} signal")
+                    return False
+                if not self._selector.select(remaining):
+                    continue
+                chunk = os.read(self._signal_fd, 64)
+                if not chunk:
+                    # A final signal may lack its trailing newline
+                    if self._buffer:
+                        self._record_signal(self._buffer)
+                        self._buffer = b""
+                    if expected in self._seen_signals:
+                        break
+                    debug_log(f"WARNING: Animation exited before {token} signal")
+                    return False
+                *lines, self._buffer = (self._buffer + chunk).split(b"\n")
+                for line in lines:
+                    self._record_signal(line)
+        except OSError as e:
             debug_log(f"Error reading animation signals: {e}")
-        finally:
-            # If process exits without signaling, set events to unblock waiters
-            self.ready_event.set()
-            self.black_event.set()
-
-    def wait_ready(self, timeout=5.0):
-        """Wait for animation to signal READY (overlay is visible)."""
-        debug_log(f"Waiting for READY signal (timeout={timeout}s)")
-        result = self.ready_event.wait(timeout=timeout)
-        if not result:
-            debug_log("WARNING: Timeout waiting for READY signal")
-        return result
-
-    def wait_black(self, timeout=30.0):
-        """Wait for animation to signal BLACK (animation complete)."""
-        debug_log(f"Waiting for BLACK signal (timeout={timeout}s)")
-        result = self.black_event.wait(timeout=timeout)
-        if not result:
-            debug_log("WARNING: Timeout waiting for BLACK signal")
-        return result
+            return False
+        return True
+
+    def _record_signal(self, line):
+        """Remember one line of animation output as a seen signal."""
+        line = line.strip()
+        debug_log(f"Animation signal: {line.decode(errors='replace')}")
+        self._seen_signals.add(line)
 
     def is_running(self):
         """Check if animation process is still running."""
@@ -244,64 +331,113 @@ class AnimationProcess:
                 self.process.wait(timeout=2)
             except subprocess.TimeoutExpired:
                 self.process.kill()
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        if self._signal_fd is not None:
+            os.close(self._signal_fd)
+            self._signal_fd = None
+
+
+_WayfireSocket = None  # Imported on first IPC call, off the startup path
+
 
+def send_ipc_batch(methods):
+    """Send several IPC commands to Wayfire over a single connection.
 
-def send_ipc(method):
-    """Send IPC command to Wayfire."""
+    Requests are written back-to-back, then one reply is read per request.
+    """
+    global _WayfireSocket
     try:
-        from wayfire import WayfireSocket
-        import json
-        sock = WayfireSocket()
+        if _WayfireSocket is None:
+            from wayfire import WayfireSocket as _WayfireSocket
+        sock = _WayfireSocket()
         sock.client.settimeout(2.0)
-        msg = json.dumps({"method": method, "data": {}}).encode('utf8')
-        sock.client.send(len(msg).to_bytes(4, byteorder='little') + msg)
-        sock.read_message()
+        payload = b""
+        for method in methods:
+            msg = json.dumps({"method": method, "data": {}}).encode('utf8')
+            payload += len(msg).to_bytes(4, byteorder='little') + msg
+        sock.client.sendall(payload)
+        for _ in methods:
+            sock.read_message()
         sock.close()
         return True
     except Exception as e:
-        debug_log(f"WARNING: IPC {method} failed: {e}")
+        debug_log(f"WARNING: IPC {', '.join(methods)} failed: {e}")
         return False
 
 
-def send_ipc_with_retry(method, max_attempts=5, delay=1.0):
-    """Send IPC command with retry logic (for post-resume when compositor may be slow)."""
+def send_ipc_with_retry(methods, max_attempts=9):
+    """Send IPC commands with retry logic (for post-resume when compositor may be slow).
+
+    Backs off exponentially from 50ms, capped at 800ms per wait (~4s total).
+    """
+    names = ', '.join(methods)
     for attempt in range(max_attempts):
-        if send_ipc(method):
+        if send_ipc_batch(methods):
             return True
         if attempt < max_attempts - 1:
-            debug_log(f"Retrying {method} in {delay}s (attempt {attempt + 1}/{max_attempts})")
+            delay = min(0.05 * (2 ** attempt), 0.8)
+            debug_log(f"Retrying {names} in {delay}s (attempt {attempt + 1}/{max_attempts})")
             time.sleep(delay)
-    debug_log(f"ERROR: {method} failed after {max_attempts} attempts")
+    debug_log(f"ERROR: {names} failed after {max_attempts} attempts")
     return False
 
 
-def unfreeze_compositor(retry=False):
-    """Unfreeze the compositor (cleanup for test mode or suspend resume)."""
+def restore_desktop(retry=False):
+    """Unfreeze the compositor and show the cursor (cleanup for test mode or suspend resume)."""
+    methods = ["screen-freeze/unfreeze", "cursor-control/show"]
     if retry:
-        success = send_ipc_with_retry("screen-freeze/unfreeze")
+        success = send_ipc_with_retry(methods)
     else:
-        success = send_ipc("screen-freeze/unfreeze")
+        success = send_ipc_batch(methods)
     if success:
-        debug_log("Compositor unfrozen")
+        debug_log("Compositor unfrozen, cursor restored")
 
 
-def show_cursor(retry=False):
-    """Show the cursor (cleanup for test mode or suspend resume)."""
-    if retry:
-        success = send_ipc_with_retry("cursor-control/show")
-    else:
-        success = send_ipc("cursor-control/show")
-    if success:
-        debug_log("Cursor restored")
+def exec_power_command(cmd, animation=None):
+    """Replace this process with cmd; only returns (False) if the exec fails.
+
+    The animation stays alive holding the black screen until the kernel
+    tears it down. Our end of its signal pipe is close-on-exec and closes
+    here; the animation's own copy of the read end keeps its stdout usable.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)  # Close-on-exec
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    # Errors from cmd (e.g. the windows boot-entry warning) go to the debug
+    # log, already opened by the caller's debug_log() calls
+    os.dup2(_LOG_FH.fileno(), 2)
+    _restore_default_signals()
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError as e:
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+        install_signal_handlers()
+        debug_log(f"ERROR: Could not execute {cmd[0]}: {e}")
+        print(f"ERROR: Could not execute {cmd[0]}: {e}", file=sys.stderr)
+        if animation:
+            animation.terminate()
+        restore_desktop()
+        return False
 
 
-def execute_power_action(action, animation=None, hold_time=3):
+def execute_power_action(action, animation=None, hold_time=DEFAULT_HOLD_TIME):
     """Execute the power action.
 
     Args:
         action: The power action to execute
         animation: Optional AnimationProcess to terminate in test mode
         hold_time: How long to hold in test mode (seconds)
+
+    Returns:
+        False if the power action could not be started, True otherwise
     """
     cmd = POWER_COMMANDS.get(action)
 
@@ -313,69 +449,65 @@ def execute_power_action(action, animation=None, hold_time=3):
         if animation:
             animation.terminate()
         # Cleanup: unfreeze compositor and restore cursor
-        unfreeze_compositor()
-        show_cursor()
+        restore_desktop()
         debug_log("[TEST] Done")
         print("[TEST] Done.")
-        return
+        return True
 
     # Logout needs session ID
     if action == "logout":
         session_id = get_session_id()
         if session_id:
-            cmd = ["loginctl", "terminate-session", session_id]
+            cmd = ("loginctl", "terminate-session", session_id)
             debug_log(f"Logout: using session ID {session_id}")
         else:
             debug_log("ERROR: Could not determine session ID for logout")
             print("ERROR: Could not determine session ID for logout", file=sys.stderr)
             if animation:
                 animation.terminate()
-            return
+            return False
 
-    # Windows needs boot entry
-    if action == "windows":
-        debug_log("Setting Windows boot entry...")
-        result = subprocess.run(
-            ["sudo", "-A", "efibootmgr", "--bootnext", "0003"],
-            capture_output=True, text=True
-        )
-        if result.returncode != 0:
-            debug_log(f"WARNING: efibootmgr failed: {result.stderr}")
-            print("WARNING: Could not set Windows boot entry", file=sys.stderr)
-
-    debug_log(f"Executing power action: {' '.join(cmd)}")
-    print(f"Executing: {' '.join(cmd)}")
-    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-
-    # Keep process alive until system powers off
-    if action in ("suspend", "hibernate"):
-        debug_log("Waiting for resume from suspend/hibernate...")
-        time.sleep(3)  # Brief pause for compositor to wake up
-        if animation:
-            animation.terminate()
-        # Cleanup after resume (use retry since compositor may be slow)
-        unfreeze_compositor(retry=True)
-        show_cursor(retry=True)
-        debug_log("Resumed from suspend/hibernate, compositor unfrozen")
-    else:
-        # Hold indefinitely until killed by shutdown
-        debug_log("Holding until system shuts down...")
-        while True:
-            time.sleep(1)
+    cmd_str = ' '.join(cmd)
+    debug_log(f"Executing power action: {cmd_str}")
+    print(f"Executing: {cmd_str}")
 
+    if action in TERMINAL_ACTIONS:
+        # Replace this process with the power command - nothing left to do
+        debug_log("Handing off to power command, holding until system shuts down...")
+        return exec_power_command(cmd, animation)
 
-def run_without_animation(action, hold_time=3):
-    """Execute power action without animation (instant/graceful mode)."""
-    debug_log(f"Running without animation: {action}")
+    # Restore defaults around the spawn rather than via preexec_fn, which
+    # would cost subprocess its vfork fast path (no threads here to race)
+    _restore_default_signals()
+    try:
+        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    finally:
+        install_signal_handlers()
+
+    # Wait for resume, then clean up
+    debug_log("Waiting for resume from suspend/hibernate...")
+    time.sleep(3)  # Brief pause for compositor to wake up
+    if animation:
+        animation.terminate()
+    # Cleanup after resume (use retry since compositor may be slow)
+    restore_desktop(retry=True)
+    debug_log("Resumed from suspend/hibernate, compositor unfrozen")
+    return True
+
+
+def run_without_animation(action, hold_time=DEFAULT_HOLD_TIME):
+    """Execute power action without animation (instant/graceful mode).
+
+    Runs before the debug log and signal handlers are set up, and replaces
+    this process with the power command.
+    """
     print(f"Executing {action} (no animation)...")
 
     cmd = POWER_COMMANDS.get(action)
 
     if cmd is None:  # Test mode
-        debug_log(f"[TEST] No animation, waiting {hold_time} seconds...")
         print(f"[TEST] No animation. Waiting {hold_time} seconds...")
         time.sleep(hold_time)
-        debug_log("[TEST] Done")
         print("[TEST] Done.")
         return
 
@@ -383,20 +515,13 @@ def run_without_animation(action, hold_time=3):
     if action == "logout":
         session_id = get_session_id()
         if session_id:
-            cmd = ["loginctl", "terminate-session", session_id]
+            cmd = ("loginctl", "terminate-session", session_id)
         else:
             print("ERROR: Could not determine session ID for logout", file=sys.stderr)
             return
 
-    # Windows needs boot entry
-    if action == "windows":
-        subprocess.run(
-            ["sudo", "-A", "efibootmgr", "--bootnext", "0003"],
-            capture_output=True, text=True
-        )
-
-    debug_log(f"Executing: {' '.join(cmd)}")
-    subprocess.run(cmd)
+    sys.stdout.flush()
+    os.execvp(cmd[0], cmd)
 
 
 def _emit_json(payload: dict) -> None:
@@ -433,6 +558,7 @@ def _handle_introspection(args: argparse.Namespace) -> int | None:
 
 def parse_args():
     """Parse command line arguments."""
+    import argparse
     from . import __version__
 
     available = list_animations()
@@ -461,7 +587,7 @@ Examples:
     parser.add_argument(
         "action",
         nargs="?",
-        choices=["shutdown", "reboot", "logout", "suspend", "hibernate", "windows", "test"],
+        choices=list(POWER_COMMANDS),
         help="Power action to execute"
     )
 
@@ -475,42 +601,45 @@ Examples:
     parser.add_argument(
         "--hold",
         type=int,
-        default=3,
+        default=DEFAULT_HOLD_TIME,
         metavar="SECONDS",
-        help="Hold black screen for N seconds in test mode (default: 3)"
+        help=f"Hold black screen for N seconds in test mode (default: {DEFAULT_HOLD_TIME})"
     )
 
     return parser, parser.parse_args()
 
 
 def main():
-    parser, args = parse_args()
+    # Fast path: a bare "power-manager <action>" needs no argparse
+    if len(sys.argv) == 2 and sys.argv[1] in POWER_COMMANDS:
+        action = sys.argv[1]
+        animation_name = DEFAULT_ANIMATION
+        hold_time = DEFAULT_HOLD_TIME
+    else:
+        parser, args = parse_args()
 
-    # Handle introspection flags first
-    result = _handle_introspection(args)
-    if result is not None:
-        return result
+        # Handle introspection flags first
+        result = _handle_introspection(args)
+        if result is not None:
+            return result
 
-    if not args.action:
-        parser.print_help()
-        return 1
+        if not args.action:
+            parser.print_help()
+            return 1
 
-    action = args.action
-    animation_name = args.animation
-    hold_time = args.hold
+        action = args.action
+        animation_name = args.animation
+        hold_time = args.hold
 
-    # Install signal handlers early
-    install_signal_handlers()
+    # No animation mode - execute directly, nothing to set up
+    if animation_name == "none":
+        run_without_animation(action, hold_time)
+        return 0
 
     # Initialize debug log
     init_debug_log()
     debug_log(f"Starting power-manager: action={action}, animation={animation_name}")
 
-    # No animation mode - execute directly
-    if animation_name == "none":
-        run_without_animation(action, hold_time)
-        return 0
-
     # =========================================================================
     # STEP 1: Start animation (it will capture screenshot and show overlay)
     # =========================================================================
@@ -521,19 +650,20 @@ def main():
     if not animation.start():
         print("ERROR: Failed to start animation", file=sys.stderr)
         return 1
+    install_signal_handlers()
 
     # =========================================================================
     # STEP 2: Wait for animation to signal READY (overlay visible)
     # =========================================================================
     print("[2/3] Waiting for overlay...")
-    if not animation.wait_ready(timeout=5.0):
+    if not animation.wait_for_signal("READY", 5.0):
         print("WARNING: Animation did not signal READY, proceeding anyway", file=sys.stderr)
 
     # =========================================================================
     # STEP 3: Wait for animation to reach BLACK (full black screen)
     # =========================================================================
     print("[3/3] Animation playing...")
-    if not animation.wait_black(timeout=30.0):
+    if not animation.wait_for_signal("BLACK", 30.0):
         print("WARNING: Animation did not signal BLACK, proceeding anyway", file=sys.stderr)
 
     # =========================================================================
@@ -541,7 +671,8 @@ def main():
     # =========================================================================
     print("Animation complete.")
     debug_log("Executing power action...")
-    execute_power_action(action, animation, hold_time)
+    if not execute_power_action(action, animation, hold_time):
+        return 1
 
     return 0
 
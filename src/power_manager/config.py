@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Optional
 
 
+# Values must stay immutable (str/int) - callers get shallow copies
 DEFAULT_CONFIG = {
     "default_animation": "fire",
     "debug_log": "/tmp/power-manager-debug.log",
@@ -14,7 +14,7 @@ DEFAULT_CONFIG = {
 
 def config_defaults() -> dict:
     """Return default configuration values."""
-    return copy.deepcopy(DEFAULT_CONFIG)
+    return dict(DEFAULT_CONFIG)
 
 
 def config_schema() -> dict:
@@ -43,4 +43,4 @@ def validate_config_file(config_path: Optional[Any] = None) -> list[str]:
 
 def load_config() -> dict:
     """Return resolved configuration (defaults only, no config file)."""
-    return copy.deepcopy(DEFAULT_CONFIG)
+    return dict(DEFAULT_CONFIG)